@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @dataclass(slots=True)
@@ -12,12 +15,35 @@ class TranscriptSegment:
     text: str
 
 
+@dataclass(slots=True)
+class TranscriptSegmentsSoA:
+    """Structure-of-arrays view over segments for vectorized consumers.
+
+    Contiguous timestamp arrays let duration math run as single ufunc calls
+    instead of per-segment attribute access.
+    """
+
+    starts: np.ndarray
+    ends: np.ndarray
+    texts: list[str]
+
+
 @dataclass(slots=True)
 class TranscriptionResult:
     segments: list[TranscriptSegment]
     language: str | None
     backend: str
 
+    def to_soa(self) -> TranscriptSegmentsSoA:
+        import numpy as np
+
+        count = len(self.segments)
+        return TranscriptSegmentsSoA(
+            starts=np.fromiter((item.start for item in self.segments), np.float32, count=count),
+            ends=np.fromiter((item.end for item in self.segments), np.float32, count=count),
+            texts=[item.text for item in self.segments],
+        )
+
 
 class ASRBackend(Protocol):
     def transcribe(self, audio_path: Path, language: str | None = None) -> TranscriptionResult:
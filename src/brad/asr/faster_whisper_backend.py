@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import functools
+import gc
+import os
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from brad.asr.base import TranscriptSegment, TranscriptionResult
+from brad.asr.base import TranscriptionResult, TranscriptSegment
+from brad.audio.chunking import TimeSpan
 
 
 def _auto_device() -> str:
@@ -15,6 +23,68 @@ def _auto_device() -> str:
         return "cpu"
 
 
+# Whisper's feature extractor rate; the service always feeds this backend a
+# 16 kHz mono WAV, so second-valued spans convert to sample indices with it.
+_SAMPLE_RATE = 16000
+
+# Preferred (device, compute_type) pairs, best first. int8_float16 runs int8
+# weight matmuls on Tensor Cores with fp16 activations; pure int8 is best on CPU.
+_COMPUTE_CANDIDATES: tuple[tuple[str, str], ...] = (
+    ("cuda", "int8_float16"),
+    ("cuda", "float16"),
+    ("cuda", "bfloat16"),
+    ("cpu", "int8"),
+)
+
+
+# Process-wide model cache. A plain dict instead of lru_cache so idle
+# eviction can drop a single backend's entry; cache_clear would also forget
+# models other live backends still hold, forcing duplicate multi-GB loads.
+_model_cache_lock = threading.Lock()
+_model_cache: dict[tuple[str, str, str], object] = {}
+
+
+def _build_whisper_model(model_path: str, device: str, compute_type: str):
+    """Construct a WhisperModel once per (path, device, compute_type) per process.
+
+    CLI usage builds a fresh backend per file; caching here keeps repeat
+    transcriptions from repaying the 1-2 s model load each time.
+    """
+
+    key = (model_path, device, compute_type)
+    with _model_cache_lock:
+        model = _model_cache.get(key)
+    if model is not None:
+        return model
+
+    from faster_whisper import WhisperModel  # type: ignore
+
+    model = WhisperModel(
+        model_path,
+        device=device,
+        compute_type=compute_type,
+        local_files_only=True,
+    )
+    with _model_cache_lock:
+        return _model_cache.setdefault(key, model)
+
+
+def _evict_cached_model(model_path: str, device: str, compute_type: str) -> None:
+    with _model_cache_lock:
+        _model_cache.pop((model_path, device, compute_type), None)
+
+
+def _supported_compute_types(device: str) -> set[str] | None:
+    """Ask CTranslate2 which compute types the device supports, or None if unknown."""
+
+    try:
+        import ctranslate2  # type: ignore
+
+        return set(ctranslate2.get_supported_compute_types(device))
+    except Exception:
+        return None
+
+
 class FasterWhisperBackend:
     """Local faster-whisper backend with explicit local model path."""
 
@@ -23,7 +93,8 @@ class FasterWhisperBackend:
         model_path: Path,
         *,
         device: str = "auto",
-        compute_type: str = "int8",
+        compute_type: str = "auto",
+        idle_ttl_s: float | None = None,
     ) -> None:
         if not model_path.exists():
             raise FileNotFoundError(
@@ -33,24 +104,122 @@ class FasterWhisperBackend:
         self.model_path = model_path
         self.device = _auto_device() if device == "auto" else device
         self.compute_type = compute_type
+        self.idle_ttl_s = idle_ttl_s
         self._model = None
+        self._batched = None
+        self._last_used = 0.0
+        self._idle_timer: threading.Timer | None = None
+
+    def _candidates(self) -> list[tuple[str, str]]:
+        if self.compute_type != "auto":
+            return [(self.device, self.compute_type)]
+        candidates = [pair for pair in _COMPUTE_CANDIDATES if pair[0] == self.device]
+        if self.device != "cpu":
+            candidates.append(("cpu", "int8"))
+        elif not candidates:
+            candidates = [("cpu", "int8")]
+        # Prune pairs the hardware cannot run instead of paying a failed
+        # multi-GB model load per attempt.
+        pruned: list[tuple[str, str]] = []
+        supported_by_device: dict[str, set[str] | None] = {}
+        for device, compute_type in candidates:
+            if device not in supported_by_device:
+                supported_by_device[device] = _supported_compute_types(device)
+            supported = supported_by_device[device]
+            if supported is None or compute_type in supported:
+                pruned.append((device, compute_type))
+        return pruned or [("cpu", "int8")]
+
+    def _validate_model_dir(self) -> None:
+        """Fail fast on a broken model directory instead of paying one failed
+        multi-GB load attempt per (device, compute_type) candidate."""
+
+        try:
+            import ctranslate2  # type: ignore
+
+            contains_model = getattr(ctranslate2, "contains_model", None)
+            if contains_model is None:
+                return
+            valid = bool(contains_model(str(self.model_path)))
+        except Exception:
+            return
+        if not valid:
+            raise RuntimeError(
+                f"Not a CTranslate2 model directory: {self.model_path}. "
+                "Place a faster-whisper model export there."
+            )
 
     def _load_model(self):
         if self._model is None:
             try:
-                from faster_whisper import WhisperModel  # type: ignore
+                import faster_whisper  # type: ignore  # noqa: F401
             except Exception as exc:
                 raise RuntimeError(
                     "faster-whisper is not installed. Install project dependencies first."
                 ) from exc
-            self._model = WhisperModel(
-                str(self.model_path),
-                device=self.device,
-                compute_type=self.compute_type,
-                local_files_only=True,
-            )
+            self._validate_model_dir()
+            last_error: Exception | None = None
+            for device, compute_type in self._candidates():
+                try:
+                    self._model = _build_whisper_model(str(self.model_path), device, compute_type)
+                except Exception as exc:
+                    last_error = exc
+                    continue
+                self.device = device
+                self.compute_type = compute_type
+                break
+            if self._model is None:
+                raise RuntimeError(
+                    f"Could not load faster-whisper model from {self.model_path}."
+                ) from last_error
+        self._touch()
         return self._model
 
+    def _touch(self) -> None:
+        self._last_used = time.monotonic()
+        if self.idle_ttl_s is not None and self._idle_timer is None:
+            self._schedule_idle_check()
+
+    def _schedule_idle_check(self) -> None:
+        timer = threading.Timer(self.idle_ttl_s, self._evict_if_idle)
+        timer.daemon = True
+        self._idle_timer = timer
+        timer.start()
+
+    def _evict_if_idle(self) -> None:
+        """Drop the model after idle_ttl_s without use, trading a reload on the
+        next call for GB-scale VRAM/RAM while idle."""
+
+        self._idle_timer = None
+        if self._model is None:
+            return
+        if time.monotonic() - self._last_used < self.idle_ttl_s:
+            self._schedule_idle_check()
+            return
+        self._model = None
+        self._batched = None
+        # _load_model records the (device, compute_type) that actually
+        # loaded, so this key names exactly the entry we hold.
+        _evict_cached_model(str(self.model_path), self.device, self.compute_type)
+        gc.collect()
+
+    def _batched_pipeline(self, model):
+        if self._batched is None:
+            from faster_whisper import BatchedInferencePipeline  # type: ignore
+
+            self._batched = BatchedInferencePipeline(model=model)
+        return self._batched
+
+    @staticmethod
+    def _collect_segments(segments_iter) -> list[TranscriptSegment]:
+        # Comprehension keeps the packing loop on the specialized LIST_APPEND
+        # path; the walrus strips each text exactly once.
+        return [
+            TranscriptSegment(start=float(item.start), end=float(item.end), text=text)
+            for item in segments_iter
+            if (text := item.text.strip())
+        ]
+
     def transcribe(self, audio_path: Path, language: str | None = None) -> TranscriptionResult:
         model = self._load_model()
         normalized_language = None if language in (None, "auto") else language
@@ -62,21 +231,81 @@ class FasterWhisperBackend:
             vad_filter=False,
         )
 
-        segments: list[TranscriptSegment] = []
-        for item in segments_iter:
-            text = item.text.strip()
-            if not text:
-                continue
-            segments.append(
-                TranscriptSegment(
-                    start=float(item.start),
-                    end=float(item.end),
-                    text=text,
-                )
+        return TranscriptionResult(
+            segments=self._collect_segments(segments_iter),
+            language=getattr(info, "language", normalized_language),
+            backend="faster-whisper",
+        )
+
+    def transcribe_many(
+        self,
+        audio_paths: Sequence[Path],
+        language: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[TranscriptionResult]:
+        """Transcribe a batch of files concurrently on one shared model.
+
+        CTranslate2 releases the GIL during inference, so threads fill idle
+        cores between encoder/decoder phases without Python-level contention.
+        """
+
+        self._load_model()  # Load once before fanning out.
+        if max_workers is None:
+            max_workers = max((os.cpu_count() or 4) // 2, 1) if self.device == "cpu" else 2
+        if max_workers == 1 or len(audio_paths) <= 1:
+            return [self.transcribe(path, language=language) for path in audio_paths]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(functools.partial(self.transcribe, language=language), audio_paths))
+
+    def transcribe_chunks(
+        self,
+        audio_path: Path,
+        spans: Sequence[TimeSpan],
+        language: str | None = None,
+        batch_size: int = 8,
+    ) -> TranscriptionResult:
+        """Transcribe selected time spans of one file in a single batched pass.
+
+        Batching amortizes encoder work into one GEMM call per batch instead
+        of one model invocation per chunk, which pays off on CUDA and on
+        chunk-heavy VAD output.
+        """
+
+        model = self._load_model()
+        normalized_language = None if language in (None, "auto") else language
+
+        if self.device == "cuda" or len(spans) >= 4:
+            # BatchedInferencePipeline takes clip_timestamps as a list of
+            # {"start", "end"} dicts holding sample indices (it slices
+            # audio[start:end] directly); only WhisperModel.transcribe
+            # understands the flat seconds list below.
+            pipeline = self._batched_pipeline(model)
+            segments_iter, info = pipeline.transcribe(
+                str(audio_path),
+                language=normalized_language,
+                beam_size=5,
+                batch_size=batch_size,
+                condition_on_previous_text=False,
+                clip_timestamps=[
+                    {
+                        "start": int(round(span.start * _SAMPLE_RATE)),
+                        "end": int(round(span.end * _SAMPLE_RATE)),
+                    }
+                    for span in spans
+                ],
+            )
+        else:
+            segments_iter, info = model.transcribe(
+                str(audio_path),
+                language=normalized_language,
+                beam_size=5,
+                condition_on_previous_text=False,
+                vad_filter=False,
+                clip_timestamps=[value for span in spans for value in (span.start, span.end)],
             )
 
         return TranscriptionResult(
-            segments=segments,
+            segments=self._collect_segments(segments_iter),
             language=getattr(info, "language", normalized_language),
             backend="faster-whisper",
         )
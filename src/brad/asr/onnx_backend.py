@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+
+from brad.asr.base import TranscriptionResult, TranscriptSegment
+
+TARGET_SAMPLE_RATE = 16000
+
+
+def _map_chunks(chunks) -> list[TranscriptSegment]:
+    """Map HF pipeline chunk dicts onto TranscriptSegment objects.
+
+    Runs once per emitted chunk — thousands of iterations on a long
+    recording — so the append method and dataclass constructor are bound to
+    locals, keeping each pass to dict lookups plus one allocation.
+    """
+
+    segments: list[TranscriptSegment] = []
+    append = segments.append
+    make_segment = TranscriptSegment
+    for chunk in chunks:
+        text = str(chunk.get("text", "")).strip()
+        if not text:
+            continue
+        start, end = chunk.get("timestamp") or (None, None)
+        if start is None:
+            continue
+        append(
+            make_segment(
+                start=float(start),
+                end=float(end if end is not None else start),
+                text=text,
+            )
+        )
+    return segments
+
+
+@functools.lru_cache(maxsize=1)
+def _available_runtime_providers() -> frozenset[str]:
+    """Provider discovery dlopen-probes every EP library; do it once per process."""
+
+    import onnxruntime  # type: ignore
+
+    return frozenset(onnxruntime.get_available_providers())
+
+
+@functools.lru_cache(maxsize=2)
+def _load_processor(model_path: str):
+    """Load the HF processor once per model: config JSON parsing and mel
+    filterbank construction are pure overhead to repeat per pipeline."""
+
+    from transformers import AutoProcessor  # type: ignore
+
+    processor = AutoProcessor.from_pretrained(model_path, local_files_only=True)
+    feature_extractor = processor.feature_extractor
+    mel_filters = getattr(feature_extractor, "mel_filters", None)
+    if mel_filters is not None:
+        import numpy as np
+
+        # Pin the filterbank as contiguous fp32 so every mel projection skips
+        # a float64 matmul plus downcast.
+        feature_extractor.mel_filters = np.ascontiguousarray(mel_filters, dtype=np.float32)
+    return processor
+
+
+@functools.lru_cache(maxsize=2)
+def _build_ort_pipeline(model_path: str, provider: str):
+    """Build the ORT model + HF pipeline once per (path, provider) per process."""
+
+    import onnxruntime  # type: ignore
+    from optimum.onnxruntime import ORTModelForSpeechSeq2Seq  # type: ignore
+    from transformers import pipeline  # type: ignore
+
+    session_options = onnxruntime.SessionOptions()
+    session_options.graph_optimization_level = (
+        onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    )
+    session_options.enable_mem_pattern = True
+
+    model = ORTModelForSpeechSeq2Seq.from_pretrained(
+        model_path,
+        provider=provider,
+        session_options=session_options,
+        # IOBinding keeps encoder outputs and decoder KV-cache on device,
+        # avoiding implicit host<->device copies per generate step on CUDA.
+        use_io_binding=provider == "CUDAExecutionProvider",
+        local_files_only=True,
+    )
+    processor = _load_processor(model_path)
+    return pipeline(
+        "automatic-speech-recognition",
+        model=model,
+        feature_extractor=processor.feature_extractor,
+        tokenizer=processor.tokenizer,
+    )
+
+
+class ONNXWhisperBackend:
+    """Local ONNX Runtime backend for Optimum-exported Whisper models."""
+
+    def __init__(
+        self,
+        model_path: Path,
+        *,
+        provider: str = "auto",
+        chunk_length_s: float | None = None,
+    ) -> None:
+        if not model_path.exists():
+            raise FileNotFoundError(
+                f"Model path not found: {model_path}. "
+                "Export a Whisper model with optimum-cli and place it there."
+            )
+        self.model_path = model_path
+        self.provider = provider
+        self.chunk_length_s = chunk_length_s
+        self._pipeline = None
+
+    def _resolve_provider(self) -> str:
+        available = _available_runtime_providers()
+        if self.provider != "auto":
+            if self.provider not in available:
+                allowed = ", ".join(sorted(available))
+                raise ValueError(
+                    f"Unsupported ONNX provider '{self.provider}'. Available: {allowed}"
+                )
+            return self.provider
+        if "CUDAExecutionProvider" in available:
+            return "CUDAExecutionProvider"
+        return "CPUExecutionProvider"
+
+    def _load_pipeline(self):
+        if self._pipeline is None:
+            try:
+                import optimum.onnxruntime  # type: ignore  # noqa: F401
+            except Exception as exc:
+                raise RuntimeError(
+                    "onnxruntime/optimum are not installed. Install with: pip install -e '.[onnx]'"
+                ) from exc
+            provider = self._resolve_provider()
+            self._pipeline = _build_ort_pipeline(str(self.model_path), provider)
+        return self._pipeline
+
+    @staticmethod
+    def _read_wav_mono_16k(audio_path: Path):
+        """Decode a mono 16 kHz WAV to float32 in a single libsndfile pass.
+
+        libsndfile fuses int16 -> float32 scaling into its decoder, so no
+        intermediate integer buffer or Python-level divide is needed.
+        """
+
+        try:
+            import soundfile as sf  # type: ignore
+        except Exception as exc:
+            raise RuntimeError(
+                "soundfile is not installed. Install with: pip install -e '.[onnx]'"
+            ) from exc
+
+        waveform, sample_rate = sf.read(str(audio_path), dtype="float32", always_2d=False)
+        if sample_rate != TARGET_SAMPLE_RATE:
+            raise ValueError(
+                f"Expected {TARGET_SAMPLE_RATE} Hz audio, got {sample_rate} Hz: {audio_path}"
+            )
+        if waveform.ndim != 1:
+            raise ValueError(f"Expected mono audio, got {waveform.ndim} channels: {audio_path}")
+        return waveform
+
+    def _load_waveform(self, audio_path: Path):
+        if audio_path.suffix.lower() == ".wav":
+            return self._read_wav_mono_16k(audio_path)
+        # Non-WAV input: let ffmpeg resample and pipe raw PCM straight into
+        # numpy, skipping an intermediate WAV file.
+        from brad.audio.ffmpeg import decode_to_pcm16_array
+
+        return decode_to_pcm16_array(audio_path)
+
+    def transcribe(self, audio_path: Path, language: str | None = None) -> TranscriptionResult:
+        asr = self._load_pipeline()
+        waveform = self._load_waveform(audio_path)
+        normalized_language = None if language in (None, "auto") else language
+
+        inference_kwargs: dict = {"return_timestamps": True}
+        if self.chunk_length_s is not None:
+            inference_kwargs["chunk_length_s"] = self.chunk_length_s
+        elif len(waveform) / TARGET_SAMPLE_RATE > 45.0:
+            # Long-context decoding degrades superlinearly; 30 s windows with
+            # 5 s stride keep the cost linear in audio length.
+            inference_kwargs["chunk_length_s"] = 30
+            inference_kwargs["stride_length_s"] = (5, 5)
+        if normalized_language is not None:
+            inference_kwargs["generate_kwargs"] = {"language": normalized_language}
+
+        output = asr(waveform, **inference_kwargs)
+
+        segments = _map_chunks(output.get("chunks") or [])
+
+        if not segments:
+            text = str(output.get("text", "")).strip()
+            if text:
+                duration = len(waveform) / TARGET_SAMPLE_RATE
+                segments.append(TranscriptSegment(start=0.0, end=duration, text=text))
+
+        return TranscriptionResult(
+            segments=segments,
+            language=normalized_language,
+            backend="onnx",
+        )
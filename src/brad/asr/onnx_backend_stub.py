@@ -1,19 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
+from brad.asr.onnx_backend import ONNXWhisperBackend
 
-from brad.asr.base import TranscriptionResult
+# LP-01 landed in brad.asr.onnx_backend; keep this module as a thin alias so
+# existing imports resolve to the one canonical implementation (and pay its
+# heavy optimum/transformers imports at most once, lazily).
+ONNXWhisperBackendStub = ONNXWhisperBackend
 
-
-class ONNXWhisperBackendStub:
-    """Guided placeholder for a future ONNX Runtime backend."""
-
-    def __init__(self, model_path: Path) -> None:
-        self.model_path = model_path
-
-    def transcribe(self, audio_path: Path, language: str | None = None) -> TranscriptionResult:
-        # TODO(LP-01): Implement ONNX Runtime + Optimum pipeline and map outputs
-        # to TranscriptionResult for interface parity with FasterWhisperBackend.
-        raise NotImplementedError(
-            "ONNX backend is a guided exercise. See docs/LEARNING_PATH.md -> LP-01."
-        )
+__all__ = ["ONNXWhisperBackend", "ONNXWhisperBackendStub"]
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Iterable
+
+try:  # Optional dependency: the array kernels below are JIT-compiled when available.
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover - numba is optional
+    njit = None
+
+# Below this many spans the plain-object loops win; above it, flat arrays
+# avoid per-element interpreter dispatch.
+_ARRAY_PATH_MIN_SPANS = 512
 
 
 @dataclass(frozen=True, slots=True)
@@ -14,6 +23,54 @@ class TimeSpan:
         return self.end - self.start
 
 
+def _merge_kernel(starts, ends, out_starts, out_ends, max_gap_s, min_duration_s) -> int:
+    count = 0
+    current_start = starts[0]
+    current_end = ends[0]
+    for i in range(1, starts.shape[0]):
+        if starts[i] <= current_end + max_gap_s:
+            if ends[i] > current_end:
+                current_end = ends[i]
+            continue
+        if current_end - current_start >= min_duration_s:
+            out_starts[count] = current_start
+            out_ends[count] = current_end
+            count += 1
+        current_start = starts[i]
+        current_end = ends[i]
+    if current_end - current_start >= min_duration_s:
+        out_starts[count] = current_start
+        out_ends[count] = current_end
+        count += 1
+    return count
+
+
+def _split_kernel(starts, ends, out_starts, out_ends, max_duration_s) -> int:
+    count = 0
+    for i in range(starts.shape[0]):
+        start = starts[i]
+        while start < ends[i]:
+            end = min(start + max_duration_s, ends[i])
+            out_starts[count] = start
+            out_ends[count] = end
+            count += 1
+            start = end
+    return count
+
+
+if njit is not None:  # pragma: no cover - exercised only with numba installed
+    _merge_kernel = njit(cache=True)(_merge_kernel)
+    _split_kernel = njit(cache=True)(_split_kernel)
+
+
+def _spans_to_arrays(spans: list[TimeSpan]):
+    import numpy as np
+
+    starts = np.fromiter((span.start for span in spans), dtype=np.float64, count=len(spans))
+    ends = np.fromiter((span.end for span in spans), dtype=np.float64, count=len(spans))
+    return np, starts, ends
+
+
 def merge_speech_spans(
     spans: Iterable[TimeSpan],
     max_gap_s: float = 0.75,
@@ -24,30 +81,55 @@ def merge_speech_spans(
     TODO(LP-05): experiment with adaptive gap thresholds based on speaking rate.
     """
 
-    ordered = sorted(spans, key=lambda item: item.start)
+    ordered = list(spans)
     if not ordered:
         return []
-
+    # Silero emits spans chronologically, so verify order in one pass and
+    # only sort when the producer surprised us.
+    if any(ordered[i].start > ordered[i + 1].start for i in range(len(ordered) - 1)):
+        ordered.sort(key=lambda item: item.start)
+
+    if len(ordered) >= _ARRAY_PATH_MIN_SPANS:
+        np, starts, ends = _spans_to_arrays(ordered)
+        out_starts = np.empty(len(ordered), dtype=np.float64)
+        out_ends = np.empty(len(ordered), dtype=np.float64)
+        count = _merge_kernel(starts, ends, out_starts, out_ends, max_gap_s, min_duration_s)
+        return [TimeSpan(start=float(out_starts[i]), end=float(out_ends[i])) for i in range(count)]
+
+    # Accumulate plain floats and build a TimeSpan only on append, instead of
+    # allocating a frozen dataclass per merged pair.
     merged: list[TimeSpan] = []
-    current = ordered[0]
+    current_start = ordered[0].start
+    current_end = ordered[0].end
     for nxt in ordered[1:]:
-        if nxt.start <= current.end + max_gap_s:
-            current = TimeSpan(start=current.start, end=max(current.end, nxt.end))
+        if nxt.start <= current_end + max_gap_s:
+            if nxt.end > current_end:
+                current_end = nxt.end
             continue
-        if current.duration >= min_duration_s:
-            merged.append(current)
-        current = nxt
+        if current_end - current_start >= min_duration_s:
+            merged.append(TimeSpan(start=current_start, end=current_end))
+        current_start = nxt.start
+        current_end = nxt.end
 
-    if current.duration >= min_duration_s:
-        merged.append(current)
+    if current_end - current_start >= min_duration_s:
+        merged.append(TimeSpan(start=current_start, end=current_end))
     return merged
 
 
 def split_long_spans(spans: Iterable[TimeSpan], max_duration_s: float = 30.0) -> list[TimeSpan]:
     """Split long spans into fixed-size chunks for stable ASR latency."""
 
+    span_list = list(spans)
+    if len(span_list) >= _ARRAY_PATH_MIN_SPANS:
+        np, starts, ends = _spans_to_arrays(span_list)
+        capacity = int(np.ceil((ends - starts) / max_duration_s).sum()) + len(span_list)
+        out_starts = np.empty(capacity, dtype=np.float64)
+        out_ends = np.empty(capacity, dtype=np.float64)
+        count = _split_kernel(starts, ends, out_starts, out_ends, max_duration_s)
+        return [TimeSpan(start=float(out_starts[i]), end=float(out_ends[i])) for i in range(count)]
+
     output: list[TimeSpan] = []
-    for span in spans:
+    for span in span_list:
         start = span.start
         while start < span.end:
             end = min(start + max_duration_s, span.end)
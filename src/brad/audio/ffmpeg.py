@@ -29,34 +29,121 @@ def _run_ffmpeg(args: list[str]) -> None:
         subprocess.run(
             ["ffmpeg", "-hide_banner", "-loglevel", "error", *args],
             check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+    except FileNotFoundError as exc:
+        raise FfmpegError("ffmpeg is not installed or not available on PATH.") from exc
+    except subprocess.CalledProcessError as exc:
+        # stderr stays bytes on the success path; decode only when reporting.
+        stderr = exc.stderr.decode(errors="replace").strip() if exc.stderr else ""
+        raise FfmpegError(stderr or "Unknown ffmpeg error.") from exc
+
+
+def decode_to_pcm16_array(input_path: Path):
+    """Decode any ffmpeg-readable input straight to a mono 16 kHz float32 array.
+
+    Piping s16le PCM over stdout skips the intermediate WAV file that
+    convert_to_mono_16k_wav would write and a reader would immediately
+    re-parse: one full waveform round-trip through the filesystem saved.
+    """
+
+    import numpy as np
+
+    try:
+        completed = subprocess.run(
+            [
+                "ffmpeg",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-i",
+                str(input_path),
+                "-ac",
+                "1",
+                "-ar",
+                "16000",
+                "-f",
+                "s16le",
+                "-",
+            ],
             capture_output=True,
-            text=True,
+            check=True,
         )
     except FileNotFoundError as exc:
         raise FfmpegError("ffmpeg is not installed or not available on PATH.") from exc
     except subprocess.CalledProcessError as exc:
-        stderr = exc.stderr.strip() if exc.stderr else "Unknown ffmpeg error."
-        raise FfmpegError(stderr) from exc
+        stderr = exc.stderr.decode(errors="replace").strip() if exc.stderr else ""
+        raise FfmpegError(stderr or "Unknown ffmpeg error.") from exc
+
+    # Fused convert+scale: one ufunc pass instead of a widening astype copy
+    # followed by a full-array divide (the loop is memory-bound).
+    view = np.frombuffer(completed.stdout, dtype=np.int16)
+    out = np.empty(view.shape[0], dtype=np.float32)
+    np.multiply(view, np.float32(1.0 / 32768.0), out=out, casting="unsafe")
+    return out
+
+
+# SoX resampler: hand-vectorized and 2-3x faster than swresample on long
+# files; precision=20 stays well above ASR fidelity needs.
+_SOXR_FILTER = "aresample=resampler=soxr:precision=20:dither_method=shibata"
 
 
 def convert_to_mono_16k_wav(input_path: Path, output_path: Path) -> Path:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    _run_ffmpeg(
-        [
-            "-y",
-            "-i",
-            str(input_path),
-            "-ac",
-            "1",
-            "-ar",
-            "16000",
-            "-vn",
-            str(output_path),
-        ]
-    )
+    base_args = [
+        "-y",
+        "-threads",
+        "0",
+        "-i",
+        str(input_path),
+        "-ac",
+        "1",
+        "-ar",
+        "16000",
+        "-vn",
+    ]
+    try:
+        _run_ffmpeg([*base_args, "-af", _SOXR_FILTER, str(output_path)])
+    except FfmpegError:
+        # ffmpeg built without libsoxr: fall back to the default resampler.
+        _run_ffmpeg([*base_args, str(output_path)])
     return output_path
 
 
+def extract_wav_segments_batch(
+    input_wav: Path,
+    out_specs: list[tuple[Path, float, float]],
+) -> list[Path]:
+    """Extract many (output_wav, start_s, end_s) segments in one ffmpeg run.
+
+    One process demuxes the input once and fans out to N output groups,
+    instead of N spawns each re-seeking the file. PCM wav in, PCM wav out,
+    so each output is a cheap re-encode of an already-decoded stream.
+    """
+
+    if not out_specs:
+        return []
+    args = ["-y", "-i", str(input_wav)]
+    for output_wav, start_s, end_s in out_specs:
+        if end_s <= start_s:
+            raise ValueError("Chunk end time must be greater than start time.")
+        output_wav.parent.mkdir(parents=True, exist_ok=True)
+        args.extend(
+            [
+                "-ss",
+                f"{start_s:.3f}",
+                "-to",
+                f"{end_s:.3f}",
+                "-acodec",
+                "pcm_s16le",
+                str(output_wav),
+            ]
+        )
+    _run_ffmpeg(args)
+    return [spec[0] for spec in out_specs]
+
+
 def extract_wav_segment(input_wav: Path, output_wav: Path, start_s: float, end_s: float) -> Path:
     if end_s <= start_s:
         raise ValueError("Chunk end time must be greater than start time.")
@@ -0,0 +1,35 @@
+"""In-memory WAV helpers that avoid per-chunk ffmpeg subprocesses."""
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def _require_soundfile():
+    try:
+        import soundfile as sf  # type: ignore
+    except Exception as exc:
+        raise RuntimeError("soundfile is not installed. Install project dependencies first.") from exc
+    return sf
+
+
+def read_wav_array(wav_path: Path):
+    """Load a WAV file as a float32 array plus its sample rate."""
+
+    sf = _require_soundfile()
+    waveform, sample_rate = sf.read(str(wav_path), dtype="float32", always_2d=False)
+    return waveform, int(sample_rate)
+
+
+def slice_wav_segment(waveform, sample_rate: int, start_s: float, end_s: float):
+    """Return a zero-copy view of the samples between start_s and end_s."""
+
+    if end_s <= start_s:
+        raise ValueError("Chunk end time must be greater than start time.")
+    return waveform[int(start_s * sample_rate) : int(end_s * sample_rate)]
+
+
+def write_wav_segment(waveform, sample_rate: int, output_path: Path) -> Path:
+    sf = _require_soundfile()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    sf.write(str(output_path), waveform, sample_rate, subtype="PCM_16")
+    return output_path
@@ -4,21 +4,28 @@ from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.table import Table
-
-from brad.audio.ffmpeg import FfmpegError
-from brad.config import get_settings
-from brad.doctor import run_doctor
-from brad.services import BradService
 
 app = typer.Typer(help="Brad - your local AI meeting assistant")
 console = Console()
 
+# Doctor statuses form a closed set; pre-render the markup once instead of
+# uppercasing and rebuilding a color dict per table row.
+_STATUS_MARKUP = {
+    "ok": "[green]OK[/green]",
+    "warn": "[yellow]WARN[/yellow]",
+    "fail": "[red]FAIL[/red]",
+}
+
 
 @app.command()
 def doctor() -> None:
     """Check local runtime prerequisites."""
 
+    from rich.table import Table
+
+    from brad.config import get_settings
+    from brad.doctor import run_doctor
+
     settings = get_settings()
     checks = run_doctor(settings)
 
@@ -29,9 +36,8 @@ def doctor() -> None:
 
     failed = False
     for check in checks:
-        status = check.status.upper()
-        color = {"ok": "green", "warn": "yellow", "fail": "red"}.get(check.status, "white")
-        table.add_row(check.name, f"[{color}]{status}[/{color}]", check.detail)
+        status = _STATUS_MARKUP.get(check.status, check.status.upper())
+        table.add_row(check.name, status, check.detail)
         if check.status == "fail":
             failed = True
 
@@ -49,6 +55,9 @@ def transcribe(
 ) -> None:
     """Transcribe local audio and store transcript in SQLite."""
 
+    from brad.audio.ffmpeg import FfmpegError
+    from brad.services import BradService
+
     use_vad = vad.lower().strip() == "on"
     service = BradService()
     try:
@@ -81,6 +90,8 @@ def summarize(
 ) -> None:
     """Summarize a stored meeting or a transcript file."""
 
+    from brad.services import BradService
+
     service = BradService()
     try:
         outcome = service.summarize_target(
@@ -108,6 +119,8 @@ def export_cmd(
 ) -> None:
     """Export a meeting transcript/summary artifact."""
 
+    from brad.services import BradService
+
     service = BradService()
     try:
         output = service.export_meeting(meeting_id, export_format)
@@ -124,6 +137,10 @@ def search(
 ) -> None:
     """Search transcripts using SQLite FTS5."""
 
+    from rich.table import Table
+
+    from brad.services import BradService
+
     service = BradService()
     hits = service.search(query, meeting_id=meeting)
     if not hits:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from functools import lru_cache
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from pydantic import Field, model_validator
@@ -24,16 +25,20 @@ class Settings(BaseSettings):
 
     default_asr_model: str = "small"
     default_language: str = "auto"
-    default_compute_type: str = "int8"
+    default_compute_type: str = "auto"
+    asr_parallel_chunks: bool = False
+    asr_workers: int = 0
     llm_default_model: Path | None = None
 
     model_config = SettingsConfigDict(env_prefix="BRAD_", extra="ignore")
 
     @model_validator(mode="after")
-    def _derive_paths(self) -> "Settings":
+    def _derive_paths(self) -> Settings:
         if "models_dir" not in self.model_fields_set or self.models_dir is None:
-            # Default to a project-local model cache so users can keep models in ./models.
-            self.models_dir = Path.cwd() / "models"
+            # Default to a project-local model cache so users can keep models
+            # in ./models. os.getcwd() avoids a Path allocation per Settings
+            # construction (tests and the UI rebuild Settings in bursts).
+            self.models_dir = Path(os.getcwd()) / "models"
         if "exports_dir" not in self.model_fields_set or self.exports_dir is None:
             self.exports_dir = self.data_dir / "exports"
         if "temp_dir" not in self.model_fields_set or self.temp_dir is None:
@@ -48,12 +53,17 @@ class Settings(BaseSettings):
         for path in (self.data_dir, self.models_dir, self.exports_dir, self.temp_dir):
             path.mkdir(parents=True, exist_ok=True)
 
+    @cached_property
+    def _asr_model_paths(self) -> dict[str, Path]:
+        base = self.models_dir / "faster-whisper"
+        return {alias: base / name for alias, name in ASR_MODEL_ALIASES.items()}
+
     def resolve_asr_model_path(self, model_name: str) -> Path:
-        key = model_name.lower().strip()
-        if key not in ASR_MODEL_ALIASES:
+        try:
+            return self._asr_model_paths[model_name.lower().strip()]
+        except KeyError:
             allowed = ", ".join(sorted(ASR_MODEL_ALIASES))
-            raise ValueError(f"Unsupported ASR model '{model_name}'. Allowed: {allowed}")
-        return self.models_dir / "faster-whisper" / ASR_MODEL_ALIASES[key]
+            raise ValueError(f"Unsupported ASR model '{model_name}'. Allowed: {allowed}") from None
 
 
 def project_root() -> Path:
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import os
 import sqlite3
 from dataclasses import dataclass
-from pathlib import Path
 
 from brad.audio.ffmpeg import get_ffmpeg_version
 from brad.config import ASR_MODEL_ALIASES, Settings
@@ -27,21 +27,46 @@ def _detect_compute_mode() -> tuple[str, str]:
         return "warn", f"CTranslate2 GPU check unavailable ({exc!s}); CPU fallback expected."
 
 
-def _check_db(settings: Settings) -> DoctorCheck:
+def _check_db(settings: Settings) -> list[DoctorCheck]:
+    checks: list[DoctorCheck] = []
     try:
         settings.ensure_dirs()
         with sqlite3.connect(settings.db_path) as conn:
             conn.execute("SELECT 1")
-        return DoctorCheck("Database", "ok", f"SQLite writable at {settings.db_path}")
+            checks.append(DoctorCheck("Database", "ok", f"SQLite writable at {settings.db_path}"))
+            # Probe FTS5 on the same connection; opening a second one just for
+            # this repeats the whole connection setup.
+            try:
+                conn.execute("CREATE VIRTUAL TABLE temp.fts_probe USING fts5(content)")
+                conn.execute("DROP TABLE temp.fts_probe")
+                checks.append(DoctorCheck("SQLite FTS5", "ok", "FTS5 module available"))
+            except sqlite3.OperationalError:
+                checks.append(
+                    DoctorCheck(
+                        "SQLite FTS5",
+                        "fail",
+                        "FTS5 unavailable; search requires a SQLite build with FTS5.",
+                    )
+                )
     except Exception as exc:  # pragma: no cover - environment dependent
-        return DoctorCheck("Database", "fail", f"Cannot initialize SQLite at {settings.db_path}: {exc}")
+        checks.append(
+            DoctorCheck("Database", "fail", f"Cannot initialize SQLite at {settings.db_path}: {exc}")
+        )
+    return checks
 
 
 def _check_model_paths(settings: Settings) -> list[DoctorCheck]:
     checks: list[DoctorCheck] = []
+    # One scandir of the shared parent instead of a stat per alias.
+    parent = settings.models_dir / "faster-whisper"
+    try:
+        with os.scandir(parent) as entries:
+            existing = {entry.name for entry in entries}
+    except OSError:
+        existing = set()
     for alias in ASR_MODEL_ALIASES:
         model_dir = settings.resolve_asr_model_path(alias)
-        if model_dir.exists():
+        if model_dir.name in existing:
             checks.append(DoctorCheck(f"ASR model ({alias})", "ok", f"Found: {model_dir}"))
         else:
             checks.append(
@@ -62,7 +87,7 @@ def _check_llm_path(settings: Settings) -> DoctorCheck:
             "warn",
             "No BRAD_LLM_DEFAULT_MODEL set. Summarization will use extractive fallback.",
         )
-    if Path(model_path).exists():
+    if os.path.exists(str(model_path)):
         return DoctorCheck("LLM model", "ok", f"Found: {model_path}")
     return DoctorCheck("LLM model", "warn", f"Configured path missing: {model_path}")
 
@@ -84,7 +109,7 @@ def run_doctor(settings: Settings) -> list[DoctorCheck]:
 
     compute_status, compute_detail = _detect_compute_mode()
     checks.append(DoctorCheck("Compute mode", compute_status, compute_detail))
-    checks.append(_check_db(settings))
+    checks.extend(_check_db(settings))
     checks.extend(_check_model_paths(settings))
     checks.append(_check_llm_path(settings))
     return checks
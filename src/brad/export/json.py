@@ -5,6 +5,11 @@ from typing import Any
 
 from brad.storage.models import MeetingRecord, SegmentRecord, SummaryRecord
 
+try:  # C serializer; stdlib json remains as fallback.
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - depends on environment
+    orjson = None
+
 
 def build_payload(
     meeting: MeetingRecord,
@@ -20,10 +25,9 @@ def build_payload(
             "model_name": meeting.model_name,
             "duration_seconds": meeting.duration_seconds,
         },
-        "segments": [
-            {"id": item.id, "start": item.start, "end": item.end, "text": item.text}
-            for item in segments
-        ],
+        # Raw records; converted lazily by _default during serialization so no
+        # intermediate dict per segment is materialized up front.
+        "segments": list(segments),
         "summary": (
             {
                 "id": summary.id,
@@ -38,5 +42,29 @@ def build_payload(
     }
 
 
+def _default(obj: Any) -> dict[str, Any]:
+    if isinstance(obj, SegmentRecord):
+        return {"id": obj.id, "start": obj.start, "end": obj.end, "text": obj.text}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def dumps_payload(payload: dict[str, Any]) -> str:
-    return json.dumps(payload, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        # OPT_PASSTHROUGH_DATACLASS routes records through _default instead of
+        # orjson's built-in dataclass handling, keeping the schema stable.
+        option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+        return orjson.dumps(payload, default=_default, option=option).decode("utf-8")
+    return json.dumps(payload, default=_default, ensure_ascii=False, indent=2)
+
+
+def dumps_payload_bytes(payload: dict[str, Any]) -> bytes:
+    """UTF-8 bytes variant for callers that write straight to disk.
+
+    orjson produces bytes natively, so this skips the decode to str and the
+    re-encode write_text would do.
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+        return orjson.dumps(payload, default=_default, option=option)
+    return json.dumps(payload, default=_default, ensure_ascii=False, indent=2).encode("utf-8")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Protocol, Sequence
+from collections.abc import Sequence
+from typing import Protocol
 
 
 class SRTSegment(Protocol):
@@ -10,13 +11,12 @@ class SRTSegment(Protocol):
 
 
 def format_timestamp(seconds: float) -> str:
-    total_ms = int(round(max(seconds, 0.0) * 1000.0))
-    hours = total_ms // 3_600_000
-    total_ms %= 3_600_000
-    minutes = total_ms // 60_000
-    total_ms %= 60_000
-    secs = total_ms // 1000
-    millis = total_ms % 1000
+    # divmod halves the arithmetic bytecodes vs separate // and %= per unit;
+    # this runs twice per cue so the inner loop matters for big exports.
+    total_ms = round(seconds * 1000.0) if seconds > 0.0 else 0
+    hours, total_ms = divmod(total_ms, 3_600_000)
+    minutes, total_ms = divmod(total_ms, 60_000)
+    secs, millis = divmod(total_ms, 1000)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
@@ -26,10 +26,12 @@ def to_srt(segments: Sequence[SRTSegment]) -> str:
     TODO(LP-06): add configurable line wrapping to improve subtitle readability.
     """
 
-    lines: list[str] = []
-    for index, segment in enumerate(segments, start=1):
-        lines.append(str(index))
-        lines.append(f"{format_timestamp(segment.start)} --> {format_timestamp(segment.end)}")
-        lines.append(segment.text.strip())
-        lines.append("")
-    return "\n".join(lines).strip() + "\n"
+    # One formatted string per cue and a single join, instead of four list
+    # appends per segment.
+    body = "\n".join(
+        f"{index}\n"
+        f"{format_timestamp(segment.start)} --> {format_timestamp(segment.end)}\n"
+        f"{segment.text.strip()}\n"
+        for index, segment in enumerate(segments, start=1)
+    )
+    return body.strip() + "\n"
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import os
 from pathlib import Path
 
 from brad.config import project_root
@@ -23,6 +25,7 @@ _FALLBACK_PROMPTS: dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=1)
 def prompts_dir() -> Path:
     return project_root() / "docs" / "prompts"
 
@@ -31,6 +34,7 @@ def list_templates() -> list[str]:
     return sorted(PROMPT_FILES)
 
 
+@functools.lru_cache(maxsize=8)
 def load_template(template_name: str) -> str:
     key = template_name.lower().strip()
     if key not in PROMPT_FILES:
@@ -38,6 +42,8 @@ def load_template(template_name: str) -> str:
         raise ValueError(f"Unknown template '{template_name}'. Allowed: {allowed}")
 
     prompt_path = prompts_dir() / PROMPT_FILES[key]
-    if prompt_path.exists():
+    # os.path.exists skips pathlib's flavour dispatch; this sits on the
+    # summarize hot path (before the lru_cache warms).
+    if os.path.exists(str(prompt_path)):
         return prompt_path.read_text(encoding="utf-8")
     return _FALLBACK_PROMPTS[key]
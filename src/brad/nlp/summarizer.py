@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import functools
+import io
 import json
 import os
 import re
+from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
 
 from brad.nlp.prompts import load_template
 from brad.storage.models import SegmentRecord
 
-_STOPWORDS = {
+_STOPWORDS = frozenset({
     "the",
     "a",
     "an",
@@ -33,10 +36,10 @@ _STOPWORDS = {
     "they",
     "you",
     "i",
-}
+})
 
-_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
-_WORD_SPLIT = re.compile(r"[A-Za-z0-9_]+")
+_WORD_SPLIT = re.compile(r"[A-Za-z0-9_]+", re.ASCII)
+_ACTION_RE = re.compile(r"\b(?:action|todo|next step|will\s)", re.IGNORECASE)
 
 
 @dataclass(slots=True)
@@ -48,13 +51,25 @@ class SummaryResult:
 
 
 def _normalize_sentences(text: str) -> list[str]:
-    parts = _SENTENCE_SPLIT.split(text)
-    clean = [item.strip() for item in parts if item.strip()]
-    return clean
+    # Single left-to-right scan; the old lookbehind regex forced the engine's
+    # slow path on large transcripts.
+    sentences: list[str] = []
+    start = 0
+    for i in range(len(text) - 1):
+        if text[i] in ".!?" and text[i + 1].isspace():
+            sentence = text[start : i + 1].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = i + 2
+    tail = text[start:].strip()
+    if tail:
+        sentences.append(tail)
+    return sentences
 
 
 def _tokenize(text: str) -> list[str]:
-    return [match.group(0).lower() for match in _WORD_SPLIT.finditer(text)]
+    # findall returns plain strings; finditer would allocate a Match per token.
+    return [token.lower() for token in _WORD_SPLIT.findall(text)]
 
 
 def extractive_summary(transcript_text: str, max_sentences: int = 6) -> str:
@@ -62,11 +77,12 @@ def extractive_summary(transcript_text: str, max_sentences: int = 6) -> str:
     if not sentences:
         return "No transcript content was available."
 
-    freq: dict[str, int] = {}
-    for token in _tokenize(transcript_text):
-        if token in _STOPWORDS or len(token) < 3:
-            continue
-        freq[token] = freq.get(token, 0) + 1
+    # Counter does the increment loop in C; the comprehension only filters.
+    freq = Counter(
+        token
+        for token in _tokenize(transcript_text)
+        if len(token) >= 3 and token not in _STOPWORDS
+    )
 
     scored: list[tuple[float, str, int]] = []
     for idx, sentence in enumerate(sentences):
@@ -79,14 +95,14 @@ def extractive_summary(transcript_text: str, max_sentences: int = 6) -> str:
     if not scored:
         top = sentences[:max_sentences]
     else:
-        top = [item[1] for item in sorted(scored, key=lambda row: row[0], reverse=True)[:max_sentences]]
-        top = sorted(top, key=lambda sentence: sentences.index(sentence))
+        # The scored tuples already carry the original index, so restore
+        # transcript order by sorting on it instead of sentences.index().
+        top_items = sorted(scored, key=lambda row: row[0], reverse=True)[:max_sentences]
+        top = [sentence for _, sentence, _ in sorted(top_items, key=lambda row: row[2])]
 
-    action_lines = [
-        sentence
-        for sentence in sentences
-        if any(marker in sentence.lower() for marker in ("action", "todo", "next step", "will "))
-    ][:4]
+    # One C-level scan per sentence instead of four substring searches over a
+    # lowercased copy.
+    action_lines = [sentence for sentence in sentences if _ACTION_RE.search(sentence)][:4]
 
     lines = ["Summary (extractive):", ""]
     lines.extend(f"- {sentence}" for sentence in top)
@@ -97,9 +113,29 @@ def extractive_summary(transcript_text: str, max_sentences: int = 6) -> str:
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=2)
+def _get_llama(model_path_str: str, n_ctx: int, n_threads: int):
+    """Load a GGUF model once per (path, ctx, threads); reloading multi-GB
+    weights per summarize call dwarfs everything else. Note the cache pins
+    the weights in memory until cleared."""
+
+    from llama_cpp import Llama  # type: ignore
+
+    return Llama(
+        model_path=model_path_str,
+        n_ctx=n_ctx,
+        n_threads=n_threads,
+        verbose=False,
+    )
+
+
+def clear_llm_cache() -> None:
+    _get_llama.cache_clear()
+
+
 def _llama_summary(prompt: str, model_path: Path) -> str:
     try:
-        from llama_cpp import Llama  # type: ignore
+        import llama_cpp  # type: ignore  # noqa: F401
     except Exception as exc:
         raise RuntimeError("llama-cpp-python not installed. Install with: pip install -e '.[llm]'") from exc
 
@@ -107,12 +143,7 @@ def _llama_summary(prompt: str, model_path: Path) -> str:
         raise FileNotFoundError(f"LLM model not found: {model_path}")
 
     n_threads = max((os.cpu_count() or 4) - 1, 1)
-    llm = Llama(
-        model_path=str(model_path),
-        n_ctx=4096,
-        n_threads=n_threads,
-        verbose=False,
-    )
+    llm = _get_llama(str(model_path), 4096, n_threads)
     response = llm(
         prompt,
         max_tokens=700,
@@ -125,6 +156,14 @@ def _llama_summary(prompt: str, model_path: Path) -> str:
 
 
 def _load_transcript_text(transcript_path: Path) -> str:
+    # Key the cache on mtime so edits invalidate stale entries; summarizing
+    # one transcript with several templates then reads and parses it once.
+    return _load_transcript_text_cached(str(transcript_path), transcript_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_transcript_text_cached(path_str: str, mtime_ns: int) -> str:
+    transcript_path = Path(path_str)
     raw = transcript_path.read_text(encoding="utf-8")
     if transcript_path.suffix.lower() == ".json":
         try:
@@ -133,13 +172,27 @@ def _load_transcript_text(transcript_path: Path) -> str:
             return raw
         segments = data.get("segments")
         if isinstance(segments, list):
-            texts = [str(item.get("text", "")).strip() for item in segments if isinstance(item, dict)]
-            return "\n".join(filter(None, texts))
+            # Values are almost always strings already; check the type instead
+            # of paying a str() call per segment, and strip exactly once.
+            texts = [
+                stripped
+                for item in segments
+                if isinstance(item, dict)
+                and isinstance(text := item.get("text", ""), str)
+                and (stripped := text.strip())
+            ]
+            return "\n".join(texts)
     return raw
 
 
 def segments_to_text(segments: list[SegmentRecord]) -> str:
-    return "\n".join(f"[{item.start:.2f}-{item.end:.2f}] {item.text}" for item in segments)
+    # Stream into one growable buffer rather than materializing a list of
+    # per-segment strings for join().
+    buf = io.StringIO()
+    write = buf.write
+    for item in segments:
+        write("[%.2f-%.2f] %s\n" % (item.start, item.end, item.text))  # noqa: UP031
+    return buf.getvalue()[:-1] if segments else ""
 
 
 class MeetingSummarizer:
@@ -153,7 +206,13 @@ class MeetingSummarizer:
         prompt_template = load_template(template_name)
 
         # TODO(LP-07): improve prompt packing strategy for long transcripts.
-        clipped_text = transcript_text[-18_000:] if len(transcript_text) > 18_000 else transcript_text
+        # s[-N:] is already a no-op copy for short strings; start the clipped
+        # tail at a sentence boundary so the LLM does not see a torn token.
+        clipped_text = transcript_text[-18_000:]
+        if len(clipped_text) == 18_000:
+            cut = clipped_text.find(". ")
+            if 0 <= cut < 4_000:
+                clipped_text = clipped_text[cut + 2 :]
         prompt = (
             f"{prompt_template}\n\n"
             "Transcript:\n"
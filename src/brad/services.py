@@ -1,22 +1,30 @@
 from __future__ import annotations
 
-import shutil
-import uuid
+import functools
+import heapq
+import operator
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
-from brad.asr.base import TranscriptSegment
+from brad.asr.base import TranscriptionResult, TranscriptSegment
 from brad.asr.faster_whisper_backend import FasterWhisperBackend
 from brad.audio.chunking import build_chunks_from_vad
-from brad.audio.ffmpeg import convert_to_mono_16k_wav, extract_wav_segment
+from brad.audio.ffmpeg import convert_to_mono_16k_wav
 from brad.audio.vad import detect_speech_spans
+from brad.audio.wav import read_wav_array, slice_wav_segment, write_wav_segment
 from brad.config import Settings, get_settings
 from brad.export import json as json_export
 from brad.export.md import render_markdown
 from brad.export.srt import to_srt
 from brad.nlp.summarizer import MeetingSummarizer, SummaryResult, segments_to_text
 from brad.storage.db import BradDB
-from brad.storage.models import SearchHit
+from brad.storage.models import MeetingRecord, SearchHit, SegmentRecord, SummaryRecord
+
+_EXPORT_FORMATS = ("md", "srt", "json")
 
 
 @dataclass(slots=True)
@@ -40,11 +48,35 @@ class BradService:
         self.db = BradDB(self.settings.db_path)
         self.db.initialize()
         self.summarizer = MeetingSummarizer()
+        # Backend instances keyed by (backend, model path, compute type) so
+        # repeat transcriptions reuse the loaded weights instead of paying
+        # the multi-second model load per call.
+        self._backend_cache: dict[tuple[str, str, str], FasterWhisperBackend] = {}
+
+    def _get_backend(self, model_path: Path) -> FasterWhisperBackend:
+        key = ("faster-whisper", str(model_path), self.settings.default_compute_type)
+        backend = self._backend_cache.get(key)
+        if backend is None:
+            backend = self._backend_cache.setdefault(
+                key,
+                FasterWhisperBackend(
+                    model_path=model_path,
+                    compute_type=self.settings.default_compute_type,
+                ),
+            )
+        return backend
+
+    def clear_backend_cache(self) -> None:
+        self._backend_cache.clear()
 
-    def _temp_run_dir(self) -> Path:
-        run_dir = self.settings.temp_dir / f"run_{uuid.uuid4().hex[:8]}"
-        run_dir.mkdir(parents=True, exist_ok=True)
-        return run_dir
+    def _temp_run_dir(self) -> tempfile.TemporaryDirectory:
+        # Intermediate wavs live for seconds and are pure scratch; /dev/shm
+        # keeps them in RAM and off the disk entirely where available.
+        base = Path("/dev/shm")
+        if not base.is_dir():
+            base = self.settings.temp_dir
+            base.mkdir(parents=True, exist_ok=True)
+        return tempfile.TemporaryDirectory(prefix="brad_run_", dir=base)
 
     def _resolve_llm_model(self, llm_model: Path | None) -> Path | None:
         if llm_model is not None:
@@ -69,63 +101,147 @@ class BradService:
                 "Brad will not auto-download models. Download manually and rerun."
             )
 
-        backend = FasterWhisperBackend(
-            model_path=model_path,
-            compute_type=self.settings.default_compute_type,
-        )
+        backend = self._get_backend(model_path)
 
-        run_dir = self._temp_run_dir()
+        run_dir_handle = self._temp_run_dir()
+        run_dir = Path(run_dir_handle.name)
         prepared_wav = run_dir / "input_16k.wav"
-        detected_language: str | None = None
-        collected_segments: list[TranscriptSegment] = []
+        # Mutated by the segment generator below while add_segments consumes
+        # it, so the list/sort/max passes over a full transcript disappear.
+        state = {"language": None, "count": 0, "max_end": 0.0}
+
+        def _tracked(segments: Iterable[TranscriptSegment]) -> Iterator[TranscriptSegment]:
+            for segment in segments:
+                state["count"] += 1
+                if segment.end > state["max_end"]:
+                    state["max_end"] = segment.end
+                yield segment
 
         try:
             convert_to_mono_16k_wav(audio_file, prepared_wav)
+            chunk_jobs: list[tuple[Path, float]] = []
+            clip_result: TranscriptionResult | None = None
             if use_vad:
                 spans = detect_speech_spans(prepared_wav)
                 chunks = build_chunks_from_vad(spans)
-                if not chunks:
-                    result = backend.transcribe(prepared_wav, language=language)
-                    detected_language = result.language
-                    collected_segments = result.segments
-                else:
+                use_clip = (
+                    chunks
+                    and hasattr(backend, "transcribe_chunks")
+                    # BRAD_ASR_PARALLEL_CHUNKS opts out of the single-pass
+                    # clip path into per-chunk transcription, which the
+                    # thread pool below fans out across cores.
+                    and not self.settings.asr_parallel_chunks
+                )
+                if use_clip:
+                    # One batched pass over the prepared wav with
+                    # clip_timestamps; timestamps come back absolute, so no
+                    # chunk files and no per-chunk offsets are needed.
+                    clip_result = backend.transcribe_chunks(
+                        prepared_wav, chunks, language=language
+                    )
+                elif chunks:
+                    # One decode + numpy views per chunk instead of one ffmpeg
+                    # process (fork/exec + header parse) per chunk.
+                    waveform, sample_rate = read_wav_array(prepared_wav)
                     for index, chunk in enumerate(chunks):
                         chunk_wav = run_dir / f"chunk_{index:04d}.wav"
-                        extract_wav_segment(prepared_wav, chunk_wav, chunk.start, chunk.end)
-                        result = backend.transcribe(chunk_wav, language=language)
-                        if detected_language is None and result.language:
-                            detected_language = result.language
-                        for segment in result.segments:
-                            collected_segments.append(
-                                TranscriptSegment(
-                                    start=segment.start + chunk.start,
-                                    end=segment.end + chunk.start,
-                                    text=segment.text,
-                                )
-                            )
+                        write_wav_segment(
+                            slice_wav_segment(waveform, sample_rate, chunk.start, chunk.end),
+                            sample_rate,
+                            chunk_wav,
+                        )
+                        chunk_jobs.append((chunk_wav, chunk.start))
+
+            parallel = self.settings.asr_parallel_chunks and len(chunk_jobs) > 1
+
+            def _chunk_results() -> Iterator[tuple[float, TranscriptionResult]]:
+                if parallel:
+                    # CTranslate2 releases the GIL during decode, so threads
+                    # sharing one model keep N cores busy without the
+                    # per-process model copy a process pool would cost.
+                    workers = self.settings.asr_workers or min(
+                        len(chunk_jobs), os.cpu_count() or 1
+                    )
+                    transcribe_one = functools.partial(backend.transcribe, language=language)
+                    with ThreadPoolExecutor(max_workers=workers) as pool:
+                        yield from zip(
+                            (offset for _, offset in chunk_jobs),
+                            pool.map(transcribe_one, (job[0] for job in chunk_jobs)),
+                            strict=True,
+                        )
+                else:
+                    for chunk_wav, offset in chunk_jobs:
+                        yield offset, backend.transcribe(chunk_wav, language=language)
+
+            def _offset_segments(offset: float, result: TranscriptionResult) -> list[TranscriptSegment]:
+                if state["language"] is None and result.language:
+                    state["language"] = result.language
+                return [
+                    TranscriptSegment(
+                        start=segment.start + offset,
+                        end=segment.end + offset,
+                        text=segment.text,
+                    )
+                    for segment in result.segments
+                ]
+
+            def _segment_stream() -> Iterator[TranscriptSegment]:
+                if parallel:
+                    # Parallel results are all in hand; an O(n log k) k-way
+                    # merge tolerates segments straddling chunk boundaries
+                    # without the O(n log n) global sort this replaced.
+                    chunk_lists = [
+                        _offset_segments(offset, result) for offset, result in _chunk_results()
+                    ]
+                    yield from heapq.merge(*chunk_lists, key=operator.attrgetter("start"))
+                else:
+                    # Chunks are ordered by start and segments within a chunk
+                    # are ordered too, so sequential output is already sorted.
+                    for offset, result in _chunk_results():
+                        yield from _offset_segments(offset, result)
+
+            if clip_result is not None:
+                state["language"] = clip_result.language
+                segment_iter: Iterable[TranscriptSegment] = clip_result.segments
+            elif chunk_jobs:
+                segment_iter = _segment_stream()
             else:
                 result = backend.transcribe(prepared_wav, language=language)
-                detected_language = result.language
-                collected_segments = result.segments
+                state["language"] = result.language
+                segment_iter = result.segments
+
+            # One transaction around the whole ingest: if transcription or a
+            # segment insert raises, the rollback leaves no half-written
+            # meeting row behind.
+            with self.db.transaction():
+                meeting_id = self.db.create_meeting(
+                    source_path=str(audio_file.resolve()),
+                    language=language if language != "auto" else "unknown",
+                    model_name=model_name,
+                    duration_seconds=0.0,
+                )
+                # Streams transcription straight into batched inserts;
+                # segments from chunks not yet decoded are produced on demand.
+                self.db.add_segments(meeting_id, _tracked(segment_iter))
+                self.db.finalize_meeting(
+                    meeting_id,
+                    language=state["language"] or (language if language != "auto" else "unknown"),
+                    duration_seconds=state["max_end"],
+                )
         finally:
-            shutil.rmtree(run_dir, ignore_errors=True)
+            run_dir_handle.cleanup()
 
-        collected_segments.sort(key=lambda item: item.start)
-        duration_seconds = max((item.end for item in collected_segments), default=0.0)
+        # The segment ingest is the one write burst in the app's life; fold
+        # the WAL into the main database before the export reads start.
+        self.db.checkpoint()
 
-        meeting_id = self.db.create_meeting(
-            source_path=str(audio_file.resolve()),
-            language=detected_language or (language if language != "auto" else "unknown"),
-            model_name=model_name,
-            duration_seconds=duration_seconds,
-        )
-        self.db.add_segments(meeting_id, collected_segments)
+        detected_language = state["language"]
         export_paths = self.export_all_formats(meeting_id)
 
         return TranscriptionOutcome(
             meeting_id=meeting_id,
             language=detected_language or "unknown",
-            segment_count=len(collected_segments),
+            segment_count=state["count"],
             export_paths=export_paths,
         )
 
@@ -173,36 +289,65 @@ class BradService:
         )
         return SummaryOutcome(summary=summary, meeting_id=None)
 
-    def export_meeting(self, meeting_id: int, export_format: str) -> Path:
-        fmt = export_format.lower().strip()
-        if fmt not in {"md", "srt", "json"}:
-            raise ValueError("Unsupported export format. Use: md, srt, json")
-
-        meeting = self.db.get_meeting(meeting_id)
+    def _fetch_export_inputs(
+        self, meeting_id: int
+    ) -> tuple[MeetingRecord, list[SegmentRecord], SummaryRecord | None]:
+        meeting, segments, summary = self.db.get_meeting_bundle(meeting_id)
         if meeting is None:
             raise ValueError(f"Meeting not found: {meeting_id}")
+        return meeting, segments, summary
 
-        segments = self.db.get_segments(meeting_id)
-        summary = self.db.get_latest_summary(meeting_id)
+    @staticmethod
+    def _render_export(
+        fmt: str,
+        meeting: MeetingRecord,
+        segments: list[SegmentRecord],
+        summary: SummaryRecord | None,
+    ) -> str | bytes:
+        if fmt == "md":
+            return render_markdown(meeting, segments, summary)
+        if fmt == "srt":
+            return to_srt(segments)
+        payload = json_export.build_payload(meeting, segments, summary)
+        # orjson emits UTF-8 bytes natively; decoding to str here only for
+        # write_text to re-encode would be two wasted passes over the payload.
+        return json_export.dumps_payload_bytes(payload)
 
+    def _write_export(self, meeting_id: int, fmt: str, content: str | bytes) -> Path:
         export_dir = self.settings.exports_dir / f"meeting_{meeting_id}"
         export_dir.mkdir(parents=True, exist_ok=True)
         output_path = export_dir / f"meeting_{meeting_id}.{fmt}"
-
-        if fmt == "md":
-            content = render_markdown(meeting, segments, summary)
-        elif fmt == "srt":
-            content = to_srt(segments)
+        if isinstance(content, bytes):
+            output_path.write_bytes(content)
         else:
-            payload = json_export.build_payload(meeting, segments, summary)
-            content = json_export.dumps_payload(payload)
-
-        output_path.write_text(content, encoding="utf-8")
+            output_path.write_text(content, encoding="utf-8")
         self.db.add_export(meeting_id=meeting_id, export_format=fmt, path=str(output_path))
         return output_path
 
+    def export_meeting(self, meeting_id: int, export_format: str) -> Path:
+        fmt = export_format.lower().strip()
+        if fmt not in _EXPORT_FORMATS:
+            raise ValueError("Unsupported export format. Use: md, srt, json")
+        meeting, segments, summary = self._fetch_export_inputs(meeting_id)
+        return self._write_export(meeting_id, fmt, self._render_export(fmt, meeting, segments, summary))
+
     def export_all_formats(self, meeting_id: int) -> dict[str, Path]:
-        return {fmt: self.export_meeting(meeting_id, fmt) for fmt in ("md", "srt", "json")}
+        # One DB fetch shared by all three renders (the old loop re-read the
+        # meeting, segments and summary per format), and the renders are pure
+        # functions of those rows, so they run concurrently; writes and the
+        # export bookkeeping stay on the calling thread.
+        meeting, segments, summary = self._fetch_export_inputs(meeting_id)
+        render = functools.partial(
+            self._render_export, meeting=meeting, segments=segments, summary=summary
+        )
+        with ThreadPoolExecutor(max_workers=len(_EXPORT_FORMATS)) as pool:
+            contents = list(pool.map(render, _EXPORT_FORMATS))
+        # One commit for all three export rows instead of an fsync per format.
+        with self.db.transaction():
+            return {
+                fmt: self._write_export(meeting_id, fmt, content)
+                for fmt, content in zip(_EXPORT_FORMATS, contents, strict=True)
+            }
 
     def search(
         self,
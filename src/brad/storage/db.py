@@ -1,38 +1,152 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
 from contextlib import contextmanager
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Iterable
 
 from brad.asr.base import TranscriptSegment
-from brad.storage.fts import create_fts_schema, insert_segment_fts, search_fts
+from brad.storage.fts import create_fts_schema, search_fts
 from brad.storage.models import ExportRecord, MeetingRecord, SearchHit, SegmentRecord, SummaryRecord
 
+_SEGMENT_BATCH_SIZE = 500
+
+# Search results for a (query, meeting_id, limit) triple are stable until new
+# segments land, and UI usage re-runs the same query while the user tweaks
+# filters. 64 entries keeps the cache a few hundred KB at worst.
+_FTS_CACHE_SIZE = 64
+
+# Hot statements hoisted to module scope: one str object per statement means
+# sqlite3's statement cache (keyed by the SQL text) always hits without
+# re-hashing a freshly built string, and the queries stay greppable in one
+# place. Explicit column lists keep row order in dataclass field order.
+_SQL_INSERT_MEETING = """
+    INSERT INTO meetings(created_at, source_path, language, model_name, duration_seconds)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_SEGMENT = """
+    INSERT INTO segments(meeting_id, start_s, end_s, text)
+    VALUES (?, ?, ?, ?)
+"""
+_SQL_INSERT_SUMMARY = """
+    INSERT INTO summaries(meeting_id, created_at, template_name, method, llm_model, text)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_EXPORT = """
+    INSERT INTO exports(meeting_id, created_at, export_format, path)
+    VALUES (?, ?, ?, ?)
+"""
+_SQL_FINALIZE_MEETING = "UPDATE meetings SET language = ?, duration_seconds = ? WHERE id = ?"
+_SQL_SELECT_MEETING = """
+    SELECT id, created_at, source_path, language, model_name, duration_seconds
+    FROM meetings WHERE id = ?
+"""
+_SQL_SELECT_SEGMENTS = """
+    SELECT id, meeting_id, start_s, end_s, text
+    FROM segments WHERE meeting_id = ? ORDER BY start_s ASC
+"""
+_SQL_SELECT_SEGMENTS_LIMITED = _SQL_SELECT_SEGMENTS + " LIMIT ?"
+_SQL_SELECT_LATEST_SUMMARY = """
+    SELECT id, meeting_id, created_at, template_name, method, llm_model, text
+    FROM summaries WHERE meeting_id = ? ORDER BY id DESC LIMIT 1
+"""
+_SQL_SELECT_EXPORTS = """
+    SELECT id, meeting_id, created_at, export_format, path
+    FROM exports WHERE meeting_id = ? ORDER BY id ASC
+"""
+
+# RETURNING (SQLite >= 3.35) hands the new id back in the insert's own
+# result set, saving the extra lastrowid round trip per insert.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+if _HAS_RETURNING:
+    _SQL_INSERT_MEETING += " RETURNING id"
+    _SQL_INSERT_SUMMARY += " RETURNING id"
+    _SQL_INSERT_EXPORT += " RETURNING id"
+
 
 class BradDB:
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+        self._in_transaction = False
+        self._fts_cache: OrderedDict[tuple[str, int | None, int], list[SearchHit]] = OrderedDict()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        # One long-lived connection: reopening per call re-ran the PRAGMAs,
+        # dropped SQLite's statement cache, and paid open/fstat/close syscalls
+        # three times per export.
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, cached_statements=256
+            )
+            conn.row_factory = sqlite3.Row
+            # page_size only takes effect on a freshly created database; it
+            # must run before the first write switches the journal mode.
+            conn.execute("PRAGMA page_size = 8192;")
+            conn.execute("PRAGMA foreign_keys = ON;")
+            conn.execute("PRAGMA journal_mode = WAL;")
+            conn.execute("PRAGMA synchronous = NORMAL;")
+            conn.execute("PRAGMA temp_store = MEMORY;")
+            # 128MB page cache and a 1GB mmap window; both are upper bounds,
+            # not allocations, so small databases pay nothing for them.
+            conn.execute("PRAGMA cache_size = -131072;")
+            conn.execute("PRAGMA mmap_size = 1073741824;")
+            conn.execute("PRAGMA wal_autocheckpoint = 1000;")
+            conn.execute("PRAGMA journal_size_limit = 67108864;")
+            self._conn = conn
+        return self._conn
 
     @contextmanager
     def _session(self):
-        conn = self._connect()
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        with self._lock:
+            conn = self._connect()
+            # Inside an explicit transaction() the outer scope owns the
+            # commit/rollback; committing here would fsync per call and break
+            # the grouping the caller asked for.
+            if self._in_transaction:
+                yield conn
+                return
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    @contextmanager
+    def transaction(self):
+        """Group several BradDB calls into a single commit.
+
+        Reentrant: nested transaction() blocks and the per-call sessions they
+        contain all fold into the outermost commit, so a multi-statement
+        workflow pays one fsync instead of one per call.
+        """
+
+        with self._lock:
+            if self._in_transaction:
+                yield
+                return
+            conn = self._connect()
+            self._in_transaction = True
+            try:
+                yield
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._in_transaction = False
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def initialize(self) -> None:
         with self._session() as conn:
@@ -87,6 +201,16 @@ class BradDB:
                 )
                 """
             )
+            # (meeting_id, id DESC) satisfies get_latest_summary's ORDER BY
+            # with a single index probe instead of a scan-and-sort; the
+            # exports index does the same for the ascending listing.
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_summaries_meeting_id"
+                " ON summaries(meeting_id, id DESC)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_exports_meeting ON exports(meeting_id, id)"
+            )
             try:
                 create_fts_schema(conn)
             except sqlite3.OperationalError as exc:
@@ -97,7 +221,9 @@ class BradDB:
 
     @staticmethod
     def _now_iso() -> str:
-        return datetime.now(tz=timezone.utc).replace(microsecond=0).isoformat()
+        # timespec drops the microseconds during formatting; the old
+        # .replace(microsecond=0) built a second datetime object per call.
+        return datetime.now(UTC).isoformat(timespec="seconds")
 
     def create_meeting(
         self,
@@ -109,30 +235,47 @@ class BradDB:
     ) -> int:
         with self._session() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO meetings(created_at, source_path, language, model_name, duration_seconds)
-                VALUES (?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_MEETING,
                 (self._now_iso(), source_path, language, model_name, duration_seconds),
             )
-            return int(cursor.lastrowid)
+            return int(cursor.fetchone()[0]) if _HAS_RETURNING else int(cursor.lastrowid)
 
     def add_segments(self, meeting_id: int, segments: Iterable[TranscriptSegment]) -> None:
+        # Accepts any iterable, including a generator still producing
+        # segments: rows are flushed in fixed-size batches so a multi-hour
+        # transcript never has to be materialized as one list. The AFTER
+        # INSERT trigger mirrors each row into segments_fts.
+        batch: list[tuple[int, float, float, str]] = []
         with self._session() as conn:
             for segment in segments:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO segments(meeting_id, start_s, end_s, text)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (meeting_id, segment.start, segment.end, segment.text),
-                )
-                segment_id = int(cursor.lastrowid)
-                insert_segment_fts(conn, segment_id=segment_id, meeting_id=meeting_id, text=segment.text)
+                batch.append((meeting_id, segment.start, segment.end, segment.text))
+                if len(batch) >= _SEGMENT_BATCH_SIZE:
+                    conn.executemany(_SQL_INSERT_SEGMENT, batch)
+                    batch.clear()
+            if batch:
+                conn.executemany(_SQL_INSERT_SEGMENT, batch)
+        # New rows can change any MATCH result, so drop cached searches
+        # wholesale; they repopulate on the next query.
+        with self._lock:
+            self._fts_cache.clear()
+
+    def finalize_meeting(self, meeting_id: int, *, language: str, duration_seconds: float) -> None:
+        with self._session() as conn:
+            conn.execute(_SQL_FINALIZE_MEETING, (language, duration_seconds, meeting_id))
+
+    def checkpoint(self) -> None:
+        """Fold the WAL back into the main file and truncate it.
+
+        Worth calling once after a bulk ingest; readers that arrive later
+        then hit the main file pages directly instead of replaying the WAL.
+        """
+
+        with self._session() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
 
     def get_meeting(self, meeting_id: int) -> MeetingRecord | None:
         with self._session() as conn:
-            row = conn.execute("SELECT * FROM meetings WHERE id = ?", (meeting_id,)).fetchone()
+            row = conn.execute(_SQL_SELECT_MEETING, (meeting_id,)).fetchone()
         if row is None:
             return None
         return MeetingRecord(
@@ -144,22 +287,61 @@ class BradDB:
             duration_seconds=float(row["duration_seconds"]),
         )
 
-    def get_segments(self, meeting_id: int) -> list[SegmentRecord]:
+    def get_segments(self, meeting_id: int, limit: int | None = None) -> list[SegmentRecord]:
         with self._session() as conn:
-            rows = conn.execute(
-                "SELECT * FROM segments WHERE meeting_id = ? ORDER BY start_s ASC",
-                (meeting_id,),
-            ).fetchall()
-        return [
-            SegmentRecord(
-                id=int(row["id"]),
-                meeting_id=int(row["meeting_id"]),
-                start=float(row["start_s"]),
-                end=float(row["end_s"]),
-                text=str(row["text"]),
+            # Plain tuples on this cursor: sqlite3.Row plus per-column name
+            # lookup and int()/float() casts cost real time on hour-long
+            # transcripts, and SQLite already returns the right types. The
+            # column list matches SegmentRecord's field order.
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            if limit is None:
+                rows = cursor.execute(_SQL_SELECT_SEGMENTS, (meeting_id,)).fetchall()
+            else:
+                rows = cursor.execute(_SQL_SELECT_SEGMENTS_LIMITED, (meeting_id, limit)).fetchall()
+        return [SegmentRecord(*row) for row in rows]
+
+    def get_meeting_bundle(
+        self, meeting_id: int
+    ) -> tuple[MeetingRecord | None, list[SegmentRecord], SummaryRecord | None]:
+        """Fetch the meeting row, its segments and its latest summary at once.
+
+        Exports need all three; issuing the reads inside one session takes
+        the lock once and sees one consistent snapshot instead of three
+        separate round trips.
+        """
+
+        with self._session() as conn:
+            meeting_row = conn.execute(_SQL_SELECT_MEETING, (meeting_id,)).fetchone()
+            if meeting_row is None:
+                return None, [], None
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            segment_rows = cursor.execute(_SQL_SELECT_SEGMENTS, (meeting_id,)).fetchall()
+            summary_row = conn.execute(_SQL_SELECT_LATEST_SUMMARY, (meeting_id,)).fetchone()
+
+        meeting = MeetingRecord(
+            id=int(meeting_row["id"]),
+            created_at=str(meeting_row["created_at"]),
+            source_path=str(meeting_row["source_path"]),
+            language=str(meeting_row["language"]),
+            model_name=str(meeting_row["model_name"]),
+            duration_seconds=float(meeting_row["duration_seconds"]),
+        )
+        summary = None
+        if summary_row is not None:
+            summary = SummaryRecord(
+                id=int(summary_row["id"]),
+                meeting_id=int(summary_row["meeting_id"]),
+                created_at=str(summary_row["created_at"]),
+                template_name=str(summary_row["template_name"]),
+                method=str(summary_row["method"]),
+                llm_model=(
+                    str(summary_row["llm_model"]) if summary_row["llm_model"] is not None else None
+                ),
+                text=str(summary_row["text"]),
             )
-            for row in rows
-        ]
+        return meeting, [SegmentRecord(*row) for row in segment_rows], summary
 
     def transcript_text(self, meeting_id: int) -> str:
         segments = self.get_segments(meeting_id)
@@ -176,25 +358,14 @@ class BradDB:
     ) -> int:
         with self._session() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO summaries(meeting_id, created_at, template_name, method, llm_model, text)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_SUMMARY,
                 (meeting_id, self._now_iso(), template_name, method, llm_model, text),
             )
-            return int(cursor.lastrowid)
+            return int(cursor.fetchone()[0]) if _HAS_RETURNING else int(cursor.lastrowid)
 
     def get_latest_summary(self, meeting_id: int) -> SummaryRecord | None:
         with self._session() as conn:
-            row = conn.execute(
-                """
-                SELECT * FROM summaries
-                WHERE meeting_id = ?
-                ORDER BY id DESC
-                LIMIT 1
-                """,
-                (meeting_id,),
-            ).fetchone()
+            row = conn.execute(_SQL_SELECT_LATEST_SUMMARY, (meeting_id,)).fetchone()
         if row is None:
             return None
         return SummaryRecord(
@@ -210,20 +381,14 @@ class BradDB:
     def add_export(self, *, meeting_id: int, export_format: str, path: str) -> int:
         with self._session() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO exports(meeting_id, created_at, export_format, path)
-                VALUES (?, ?, ?, ?)
-                """,
+                _SQL_INSERT_EXPORT,
                 (meeting_id, self._now_iso(), export_format, path),
             )
-            return int(cursor.lastrowid)
+            return int(cursor.fetchone()[0]) if _HAS_RETURNING else int(cursor.lastrowid)
 
     def get_exports(self, meeting_id: int) -> list[ExportRecord]:
         with self._session() as conn:
-            rows = conn.execute(
-                "SELECT * FROM exports WHERE meeting_id = ? ORDER BY id ASC",
-                (meeting_id,),
-            ).fetchall()
+            rows = conn.execute(_SQL_SELECT_EXPORTS, (meeting_id,)).fetchall()
         return [
             ExportRecord(
                 id=int(row["id"]),
@@ -242,5 +407,19 @@ class BradDB:
         meeting_id: int | None = None,
         limit: int = 25,
     ) -> list[SearchHit]:
+        # Repeat queries skip the FTS MATCH parse and b-tree walk entirely;
+        # add_segments clears the cache so hits never go stale. A copy goes
+        # out so callers cannot mutate the cached list.
+        key = (query, meeting_id, limit)
+        with self._lock:
+            cached = self._fts_cache.get(key)
+            if cached is not None:
+                self._fts_cache.move_to_end(key)
+                return list(cached)
         with self._session() as conn:
-            return search_fts(conn, query=query, meeting_id=meeting_id, limit=limit)
+            hits = search_fts(conn, query=query, meeting_id=meeting_id, limit=limit)
+        with self._lock:
+            self._fts_cache[key] = hits
+            if len(self._fts_cache) > _FTS_CACHE_SIZE:
+                self._fts_cache.popitem(last=False)
+        return list(hits)
@@ -6,23 +6,57 @@ from brad.storage.models import SearchHit
 
 
 def create_fts_schema(conn: sqlite3.Connection) -> None:
+    # Databases written before the external-content switch carry a
+    # self-content segments_fts(segment_id, meeting_id, text). Its column 0
+    # is segment_id, so snippet(segments_fts, 0, ...) would return ids and
+    # the rowid join would only line up by accident. Drop the old shape and
+    # rebuild the index from segments below.
+    old_columns = [row[1] for row in conn.execute("PRAGMA table_info(segments_fts)")]
+    migrate_from_self_content = "segment_id" in old_columns
+    if migrate_from_self_content:
+        conn.execute("DROP TABLE segments_fts")
+
+    # External-content table: FTS5 stores only the inverted index and reads
+    # the text back from segments, halving on-disk duplication. Triggers keep
+    # the index in sync so callers never write to it directly.
     conn.execute(
         """
         CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts
         USING fts5(
-            segment_id UNINDEXED,
-            meeting_id UNINDEXED,
-            text
+            text,
+            content='segments',
+            content_rowid='id',
+            tokenize="unicode61 remove_diacritics 2 tokenchars '_-'"
         )
         """
     )
-
-
-def insert_segment_fts(conn: sqlite3.Connection, segment_id: int, meeting_id: int, text: str) -> None:
     conn.execute(
-        "INSERT INTO segments_fts(segment_id, meeting_id, text) VALUES (?, ?, ?)",
-        (segment_id, meeting_id, text),
+        """
+        CREATE TRIGGER IF NOT EXISTS segments_fts_ai AFTER INSERT ON segments BEGIN
+            INSERT INTO segments_fts(rowid, text) VALUES (new.id, new.text);
+        END
+        """
     )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS segments_fts_ad AFTER DELETE ON segments BEGIN
+            INSERT INTO segments_fts(segments_fts, rowid, text)
+            VALUES ('delete', old.id, old.text);
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS segments_fts_au AFTER UPDATE ON segments BEGIN
+            INSERT INTO segments_fts(segments_fts, rowid, text)
+            VALUES ('delete', old.id, old.text);
+            INSERT INTO segments_fts(rowid, text) VALUES (new.id, new.text);
+        END
+        """
+    )
+
+    if migrate_from_self_content:
+        conn.execute("INSERT INTO segments_fts(segments_fts) VALUES ('rebuild')")
 
 
 def search_fts(
@@ -38,9 +72,9 @@ def search_fts(
             s.start_s,
             s.end_s,
             s.text,
-            snippet(segments_fts, 2, '[', ']', ' ... ', 12) AS snippet
+            snippet(segments_fts, 0, '[', ']', ' ... ', 12) AS snippet
         FROM segments_fts
-        JOIN segments s ON s.id = segments_fts.segment_id
+        JOIN segments s ON s.id = segments_fts.rowid
         WHERE segments_fts MATCH ?
     """
     params: list[object] = [query]
@@ -50,15 +84,10 @@ def search_fts(
     sql += " ORDER BY rank LIMIT ?"
     params.append(limit)
 
-    rows = conn.execute(sql, tuple(params)).fetchall()
-    return [
-        SearchHit(
-            segment_id=int(row["segment_id"]),
-            meeting_id=int(row["meeting_id"]),
-            start=float(row["start_s"]),
-            end=float(row["end_s"]),
-            text=str(row["text"]),
-            snippet=str(row["snippet"]),
-        )
-        for row in rows
-    ]
+    # Plain tuples: the SELECT list is already in SearchHit field order, so
+    # each row constructs the dataclass positionally without sqlite3.Row's
+    # name lookups or redundant casts.
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    rows = cursor.execute(sql, tuple(params)).fetchall()
+    return [SearchHit(*row) for row in rows]
@@ -0,0 +1,36 @@
+import wave
+from pathlib import Path
+
+import pytest
+
+# One second of 16 kHz int16 silence; shorter writes slice it, longer ones
+# extend it, so the common cases never rebuild the zero block.
+_SILENCE_PCM16_1S = b"\x00\x00" * 16000
+
+
+def _write_silent_wav(path: Path, seconds: float = 1.0, sample_rate: int = 16000) -> Path:
+    needed = int(seconds * sample_rate) * 2
+    frames = (
+        _SILENCE_PCM16_1S[:needed]
+        if needed <= len(_SILENCE_PCM16_1S)
+        else b"\x00" * needed
+    )
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(sample_rate)
+        # writeframesraw skips the per-call header patch; wave fixes the
+        # header once on close.
+        handle.writeframesraw(frames)
+    return path
+
+
+@pytest.fixture(scope="session")
+def silent_wav(tmp_path_factory) -> Path:
+    """Half a second of 16 kHz mono silence, written once per test run.
+
+    Tests treat the file as read-only, so every consumer can share a single
+    mkdir/open/write instead of recreating it per test.
+    """
+
+    return _write_silent_wav(tmp_path_factory.mktemp("audio") / "silence.wav", seconds=0.5)
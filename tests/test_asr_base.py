@@ -0,0 +1,20 @@
+import pytest
+
+from brad.asr.base import TranscriptionResult, TranscriptSegment
+
+np = pytest.importorskip("numpy")
+
+
+def test_to_soa() -> None:
+    result = TranscriptionResult(
+        segments=[
+            TranscriptSegment(start=0.0, end=1.5, text="first"),
+            TranscriptSegment(start=1.5, end=4.0, text="second"),
+        ],
+        language="en",
+        backend="faster-whisper",
+    )
+    soa = result.to_soa()
+    assert soa.texts == ["first", "second"]
+    assert soa.starts.dtype == np.float32
+    assert float((soa.ends - soa.starts).sum()) == pytest.approx(4.0)
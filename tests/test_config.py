@@ -0,0 +1,28 @@
+import pytest
+
+from brad.config import Settings
+from brad.services import BradService
+
+
+def _settings(tmp_path) -> Settings:
+    return Settings(data_dir=tmp_path / "data", models_dir=tmp_path / "models")
+
+
+def test_resolve_asr_model_path_normalizes_alias(tmp_path) -> None:
+    settings = _settings(tmp_path)
+    resolved = settings.resolve_asr_model_path(" Large ")
+    assert resolved == tmp_path / "models" / "faster-whisper" / "large-v3"
+
+
+def test_resolve_asr_model_path_rejects_unknown(tmp_path) -> None:
+    settings = _settings(tmp_path)
+    with pytest.raises(ValueError):
+        settings.resolve_asr_model_path("tiny")
+
+
+def test_transcribe_file_keyword_contract() -> None:
+    # co_varnames is enough for a membership check and skips building a full
+    # Signature object (annotations, defaults, parameter ordering).
+    code = BradService.transcribe_file.__code__
+    parameters = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+    assert {"model_name", "language", "use_vad"} <= set(parameters)
@@ -0,0 +1,75 @@
+import pytest
+
+from brad.asr import faster_whisper_backend
+from brad.asr.faster_whisper_backend import FasterWhisperBackend
+from brad.audio.chunking import TimeSpan
+
+
+def _backend(tmp_path, **kwargs) -> FasterWhisperBackend:
+    return FasterWhisperBackend(tmp_path, device=kwargs.pop("device", "cpu"), **kwargs)
+
+
+def test_missing_model_path_raises(tmp_path) -> None:
+    with pytest.raises(FileNotFoundError):
+        FasterWhisperBackend(tmp_path / "missing-model")
+
+
+def test_explicit_compute_type_is_respected(tmp_path) -> None:
+    backend = _backend(tmp_path, compute_type="float16")
+    assert backend._candidates() == [("cpu", "float16")]
+
+
+def test_auto_candidates_on_cuda(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(faster_whisper_backend, "_supported_compute_types", lambda device: None)
+    backend = _backend(tmp_path, device="cuda")
+    assert backend._candidates() == [
+        ("cuda", "int8_float16"),
+        ("cuda", "float16"),
+        ("cuda", "bfloat16"),
+        ("cpu", "int8"),
+    ]
+
+
+def test_auto_candidates_pruned_by_supported_types(tmp_path, monkeypatch) -> None:
+    supported = {"cuda": {"float16"}, "cpu": {"int8", "float32"}}
+    monkeypatch.setattr(
+        faster_whisper_backend, "_supported_compute_types", lambda device: supported[device]
+    )
+    backend = _backend(tmp_path, device="cuda")
+    assert backend._candidates() == [("cuda", "float16"), ("cpu", "int8")]
+
+
+class _FakeInfo:
+    language = "en"
+
+
+def test_transcribe_chunks_clip_timestamp_shapes(tmp_path, monkeypatch) -> None:
+    # The two faster-whisper entry points disagree on the clip_timestamps
+    # contract: WhisperModel takes a flat [s0, e0, ...] list in seconds while
+    # BatchedInferencePipeline takes {"start", "end"} dicts in sample
+    # indices, which it slices out of the decoded 16 kHz waveform.
+    captured = {}
+
+    class _FakeModel:
+        def transcribe(self, path, **kwargs):
+            captured["sequential"] = kwargs["clip_timestamps"]
+            return iter(()), _FakeInfo()
+
+    class _FakePipeline:
+        def transcribe(self, path, **kwargs):
+            captured["batched"] = kwargs["clip_timestamps"]
+            return iter(()), _FakeInfo()
+
+    backend = _backend(tmp_path)
+    monkeypatch.setattr(backend, "_load_model", lambda: _FakeModel())
+    monkeypatch.setattr(backend, "_batched_pipeline", lambda model: _FakePipeline())
+
+    few = [TimeSpan(start=0.0, end=1.5), TimeSpan(start=2.0, end=3.0)]
+    backend.transcribe_chunks(tmp_path / "audio.wav", few)
+    assert captured["sequential"] == [0.0, 1.5, 2.0, 3.0]
+
+    many = [TimeSpan(start=float(i), end=float(i) + 0.5) for i in range(4)]
+    backend.transcribe_chunks(tmp_path / "audio.wav", many)
+    assert captured["batched"] == [
+        {"start": round(span.start * 16000), "end": round(span.end * 16000)} for span in many
+    ]
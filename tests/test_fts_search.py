@@ -1,3 +1,5 @@
+import sqlite3
+
 from brad.asr.base import TranscriptSegment
 from brad.storage.db import BradDB
 
@@ -23,3 +25,46 @@ def test_fts_search_basic(tmp_path) -> None:
     assert len(hits) == 1
     assert hits[0].meeting_id == meeting_id
     assert "budget" in hits[0].text.lower()
+
+
+def test_fts_migrates_old_self_content_table(tmp_path) -> None:
+    db_path = tmp_path / "brad.db"
+    db = BradDB(db_path)
+    db.initialize()
+    meeting_id = db.create_meeting(
+        source_path="demo.wav",
+        language="en",
+        model_name="small",
+        duration_seconds=4.0,
+    )
+    db.add_segments(
+        meeting_id,
+        [TranscriptSegment(start=0.0, end=2.0, text="Quarterly budget review notes.")],
+    )
+    db.close()
+
+    # Rewrite the index as the pre-external-content shape, the way older
+    # releases left it on disk.
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """
+        DROP TRIGGER segments_fts_ai;
+        DROP TRIGGER segments_fts_ad;
+        DROP TRIGGER segments_fts_au;
+        DROP TABLE segments_fts;
+        CREATE VIRTUAL TABLE segments_fts USING fts5(segment_id, meeting_id, text);
+        """
+    )
+    conn.execute(
+        "INSERT INTO segments_fts(segment_id, meeting_id, text)"
+        " SELECT id, meeting_id, text FROM segments"
+    )
+    conn.commit()
+    conn.close()
+
+    upgraded = BradDB(db_path)
+    upgraded.initialize()
+    hits = upgraded.search_segments("budget")
+    assert len(hits) == 1
+    assert hits[0].meeting_id == meeting_id
+    assert "budget" in hits[0].snippet.lower()
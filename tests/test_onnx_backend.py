@@ -0,0 +1,42 @@
+import pytest
+
+from brad.asr.onnx_backend import ONNXWhisperBackend
+
+
+def test_missing_model_path_raises(tmp_path) -> None:
+    with pytest.raises(FileNotFoundError):
+        ONNXWhisperBackend(tmp_path / "missing-model")
+
+
+def test_read_wav_mono_16k(silent_wav) -> None:
+    pytest.importorskip("soundfile")
+    waveform = ONNXWhisperBackend._read_wav_mono_16k(silent_wav)
+    assert waveform.dtype.name == "float32"
+    assert waveform.ndim == 1
+    assert len(waveform) == 8000
+
+
+def test_onnx_backend_maps_chunks(tmp_path, monkeypatch) -> None:
+    backend = ONNXWhisperBackend(tmp_path)
+
+    def fake_pipeline(waveform, **kwargs):
+        return {
+            "text": "Hello world. Second part.",
+            "chunks": [
+                {"timestamp": (0.0, 1.5), "text": " Hello world. "},
+                {"timestamp": (1.5, 3.0), "text": "Second part."},
+                {"timestamp": (3.0, 3.2), "text": "   "},
+            ],
+        }
+
+    monkeypatch.setattr(backend, "_load_pipeline", lambda: fake_pipeline)
+    monkeypatch.setattr(
+        ONNXWhisperBackend, "_read_wav_mono_16k", staticmethod(lambda path: [0.0] * 16000)
+    )
+
+    result = backend.transcribe(tmp_path / "audio.wav", language="en")
+    assert result.backend == "onnx"
+    assert result.language == "en"
+    assert [segment.text for segment in result.segments] == ["Hello world.", "Second part."]
+    assert result.segments[0].start == 0.0
+    assert result.segments[1].end == 3.0
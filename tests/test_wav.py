@@ -0,0 +1,28 @@
+import pytest
+
+from brad.audio.wav import read_wav_array, slice_wav_segment, write_wav_segment
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("soundfile")
+
+
+def test_slice_wav_segment_is_view() -> None:
+    waveform = np.zeros(16000, dtype=np.float32)
+    segment = slice_wav_segment(waveform, 16000, 0.25, 0.75)
+    assert len(segment) == 8000
+    assert segment.base is waveform
+
+
+def test_slice_wav_segment_rejects_empty_range() -> None:
+    waveform = np.zeros(100, dtype=np.float32)
+    with pytest.raises(ValueError):
+        slice_wav_segment(waveform, 16000, 1.0, 1.0)
+
+
+def test_write_and_read_roundtrip(tmp_path) -> None:
+    waveform = np.linspace(-0.5, 0.5, 1600, dtype=np.float32)
+    out_path = write_wav_segment(waveform, 16000, tmp_path / "segment.wav")
+    loaded, sample_rate = read_wav_array(out_path)
+    assert sample_rate == 16000
+    assert len(loaded) == 1600
+    assert np.allclose(loaded, waveform, atol=1.0 / 32768.0)